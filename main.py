@@ -1,4 +1,7 @@
-from src.utils.ctet_tools import file_load, get_session_metadata, get_eeg_signal, apply_bandpass_filter, apply_notch_filter, reference
+import argparse
+
+from src.utils.ctet_tools import file_load, get_session_metadata, get_eeg_signal, apply_filter_cascade, reference
+from src.utils.profiling import stage, run_with_pyinstrument
 
 
 def main():
@@ -11,40 +14,45 @@ def main():
 
     try:
         # 2. Load data
-        manager = file_load(xml_p, raw_p, tag_p)
+        with stage("file_load"):
+            manager = file_load(xml_p, raw_p, tag_p)
 
         # 3. Get Metadata
-        metadata = get_session_metadata(manager)
+        with stage("get_session_metadata"):
+            metadata = get_session_metadata(manager)
         print(
             f"Status: Successfully loaded: {metadata.num_channels} channels at {metadata.fs}Hz")
 
         # 4. Get signal
-        raw_signal = get_eeg_signal(manager)
+        with stage("get_eeg_signal"):
+            raw_signal = get_eeg_signal(manager)
         print(
             f"Status: Initial signal shape: {raw_signal.shape} (Channels x Samples)")
 
         # 5. Re-referencing
         # Option A: Applying Common Average Reference (CAR) by default - pass empty list or None
         print("Astatus: Applying CAR reference...")
-        ref_signal = reference(data=raw_signal, metadata=metadata)
+        # copy=False: raw_signal is not needed after referencing, so reuse its buffer.
+        with stage("reference"):
+            ref_signal = reference(data=raw_signal, metadata=metadata, copy=False)
 
         # Option B: Specific Reference
         # print("Status: Applying Linked Mastoids Reference...")
         # ref_signaf = reference(data=raw_signal, metadata=metadata, ref_channels=["A1", "A2"])
 
         # 6. Filtering Phase
-        # Step A: Remove 50Hz power line noise (and optionally 100Hz harmonic)
-        print("Status: Applying Notch filter (50Hz)...")
-        notch_signal = apply_notch_filter(
-            data=ref_signal, fs=metadata.fs, freq=50.0)
-
-        # Step B: Broadband filter for 1-40 Hz
-        print("Status: Applying Bandpass filter (1-40 Hz)...")
-        preprocessed_signal = apply_bandpass_filter(data=notch_signal,
-                                                    fs=metadata.fs,
-                                                    lowcut=1.0,
-                                                    highcut=40
-                                                    )
+        # Notch (50Hz power line noise) and bandpass (1-40 Hz) are stacked into
+        # one SOS cascade, so the signal is filtered in a single zero-phase pass.
+        print("Status: Applying Notch (50Hz) + Bandpass (1-40 Hz) filter cascade...")
+        # out=ref_signal: filter in place, the whole pipeline reuses one buffer.
+        with stage("filter_cascade"):
+            preprocessed_signal = apply_filter_cascade(data=ref_signal,
+                                                       fs=metadata.fs,
+                                                       stages=[
+                                                           ("notch", 50.0, 30),
+                                                           ("bandpass", 1.0, 40, 4),
+                                                       ],
+                                                       out=ref_signal)
         # 7. Final Verification
         print(f"--- Preprocessing Complete ---")
         print(f"Final signal shape: {preprocessed_signal.shape}")
@@ -55,4 +63,14 @@ def main():
 
 # This is the "Pythonic" way to start a program
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="CTET EEG preprocessing pipeline.")
+    parser.add_argument("--profile", choices=["pyinstrument"],
+                        help="Record a sampling profile of the whole run.")
+    parser.add_argument("--profile-output", default="profile.html",
+                        help="HTML report path for --profile (default: profile.html).")
+    args = parser.parse_args()
+
+    if args.profile == "pyinstrument":
+        run_with_pyinstrument(main, args.profile_output)
+    else:
+        main()
@@ -1,15 +1,17 @@
 
 
-import numpy as np
-import pandas as pd  
-import mne
-from obci_readmanager.signal_processing.read_manager import ReadManager
+if __name__ == "__main__":
+    # Environment check only - imports stay inside the guard so pulling this
+    # file in transitively does not load pandas/MNE.
+    import numpy as np
+    import pandas as pd
+    import mne
+    from obci_readmanager.signal_processing.read_manager import ReadManager
 
+    print("---TEST Środowiska---")
 
-print("---TEST Środowiska---")
-
-print(f"Numpy: {np.__version__}")
-print(f"Pandas: {pd.__version__}")
-print(f"MNE: {np.__version__}")
-print("ReadManager: Zaimportowany poprawnie")
-print("------------------------------------")
+    print(f"Numpy: {np.__version__}")
+    print(f"Pandas: {pd.__version__}")
+    print(f"MNE: {np.__version__}")
+    print("ReadManager: Zaimportowany poprawnie")
+    print("------------------------------------")
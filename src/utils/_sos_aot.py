@@ -0,0 +1,43 @@
+"""
+Ahead-of-time build of the SOS filter kernels (numba.pycc).
+
+Emits the _sos_kernels extension next to this file, so ctet_tools can skip
+JIT compilation on first use. Run once at build time from the project root:
+
+    python -m src.utils._sos_aot
+
+AOT code cannot use prange or release the GIL, so the exported kernels walk
+channel tiles serially: startup is instant, but a single core is used and
+chunk prefetching no longer overlaps with filtering. The extension is
+therefore opt-in: ctet_tools only loads it when EEG_SOS_AOT=1 is set, and
+uses the parallel JIT kernels in _sos_jit otherwise.
+"""
+
+import os
+from numba.pycc import CC
+
+from ._sos_jit import LANES, sosfilt_stream_tile, sosfiltfilt_tile
+
+
+cc = CC('_sos_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('sosfiltfilt_f32', 'f4[:,:](f4[:,:], f4[:,:], f4[:,:], i8, f4[:,:])')
+@cc.export('sosfiltfilt_f64', 'f8[:,:](f8[:,:], f8[:,:], f8[:,:], i8, f8[:,:])')
+def sosfiltfilt(sos, x, zi, padlen, out):
+    for t in range((x.shape[0] + LANES - 1) // LANES):
+        sosfiltfilt_tile(sos, x, zi, padlen, out, t)
+    return out
+
+
+@cc.export('sosfilt_stream_f32', 'f4[:,:](f4[:,:], f4[:,:], f4[:,:,:], f4[:,:])')
+@cc.export('sosfilt_stream_f64', 'f8[:,:](f8[:,:], f8[:,:], f8[:,:,:], f8[:,:])')
+def sosfilt_stream(sos, x, state, out):
+    for t in range((x.shape[0] + LANES - 1) // LANES):
+        sosfilt_stream_tile(sos, x, state, out, t)
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,180 @@
+"""
+Numba kernels for multi-channel SOS (biquad cascade) filtering.
+
+JIT-compiled on first use (and cached on disk). The same tile functions are
+compiled ahead of time by _sos_aot.py into the optional _sos_kernels
+extension, which ctet_tools uses instead only when EEG_SOS_AOT=1 is set.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+# Channels filtered side by side in one tile. Biquad states of different
+# channels are independent, so the innermost lane loop maps onto SIMD
+# registers (8 x float32 = one AVX2 vector).
+LANES = 8
+
+
+@njit(fastmath=True, cache=True)
+def seed_tile_states(zi, ext, z1, z2, edge):
+    """
+    Seeds tile states with the steady state `zi` scaled by each lane's edge sample.
+    """
+    n_sec, lanes = z1.shape
+    for s in range(n_sec):
+        for lane in range(lanes):
+            z1[s, lane] = zi[s, 0] * ext[edge, lane]
+            z2[s, lane] = zi[s, 1] * ext[edge, lane]
+
+
+@njit(fastmath=True, cache=True)
+def sos_pass_tile(sos, ext, z1, z2, reverse):
+    """
+    One in-place SOS pass over a tile of channels [n_ext x lanes].
+
+    Runs the Direct-Form-II-Transposed recurrence per section, starting from
+    (and updating) the section states `z1`, `z2` [n_sections x lanes].
+    """
+    n_ext, lanes = ext.shape
+    n_sec = sos.shape[0]
+    v = np.empty(lanes, dtype=ext.dtype)
+
+    for k in range(n_ext):
+        i = n_ext - 1 - k if reverse else k
+        for lane in range(lanes):
+            v[lane] = ext[i, lane]
+        for s in range(n_sec):
+            b0, b1, b2 = sos[s, 0], sos[s, 1], sos[s, 2]
+            a1, a2 = sos[s, 4], sos[s, 5]
+            for lane in range(lanes):
+                y = b0 * v[lane] + z1[s, lane]
+                z1[s, lane] = b1 * v[lane] - a1 * y + z2[s, lane]
+                z2[s, lane] = b2 * v[lane] - a2 * y
+                v[lane] = y
+        for lane in range(lanes):
+            ext[i, lane] = v[lane]
+
+
+@njit(fastmath=True, cache=True)
+def sosfilt_stream_tile(sos, x, state, out, t):
+    """
+    Causal SOS filtering of channel tile `t`, updating its slice of `state`.
+    """
+    n_ch, n_samp = x.shape
+    n_sec = sos.shape[0]
+    c0 = t * LANES
+    width = min(LANES, n_ch - c0)
+
+    # Unused lanes of the last tile stay zero and are discarded. The tile is
+    # fully copied in before anything is written, so `out` may alias `x`.
+    buf = np.zeros((n_samp, LANES), dtype=x.dtype)
+    z1 = np.zeros((n_sec, LANES), dtype=x.dtype)
+    z2 = np.zeros((n_sec, LANES), dtype=x.dtype)
+    for lane in range(width):
+        for i in range(n_samp):
+            buf[i, lane] = x[c0 + lane, i]
+        for s in range(n_sec):
+            z1[s, lane] = state[s, c0 + lane, 0]
+            z2[s, lane] = state[s, c0 + lane, 1]
+
+    sos_pass_tile(sos, buf, z1, z2, False)
+
+    for lane in range(width):
+        for i in range(n_samp):
+            out[c0 + lane, i] = buf[i, lane]
+        for s in range(n_sec):
+            state[s, c0 + lane, 0] = z1[s, lane]
+            state[s, c0 + lane, 1] = z2[s, lane]
+
+
+@njit(fastmath=True, cache=True)
+def sosfiltfilt_tile(sos, x, zi, padlen, out, t):
+    """
+    Zero-phase SOS filtering of channel tile `t` (forward + backward pass).
+
+    The tile is fully copied into the extension buffer before anything is
+    written, so `out` may alias `x`.
+    """
+    n_ch, n_samp = x.shape
+    n_sec = sos.shape[0]
+    n_ext = n_samp + 2 * padlen
+    c0 = t * LANES
+    width = min(LANES, n_ch - c0)
+
+    # Odd extension: 2*x[0] - x[padlen:0:-1] | x | 2*x[-1] - x[-2:-padlen-2:-1]
+    ext = np.zeros((n_ext, LANES), dtype=x.dtype)
+    for lane in range(width):
+        c = c0 + lane
+        x0 = x[c, 0]
+        xn = x[c, n_samp - 1]
+        for i in range(padlen):
+            ext[i, lane] = 2.0 * x0 - x[c, padlen - i]
+            ext[padlen + n_samp + i, lane] = 2.0 * xn - x[c, n_samp - 2 - i]
+        for i in range(n_samp):
+            ext[padlen + i, lane] = x[c, i]
+
+    # Forward pass, then backward pass over the same buffer.
+    z1 = np.empty((n_sec, LANES), dtype=x.dtype)
+    z2 = np.empty((n_sec, LANES), dtype=x.dtype)
+    seed_tile_states(zi, ext, z1, z2, 0)
+    sos_pass_tile(sos, ext, z1, z2, False)
+    seed_tile_states(zi, ext, z1, z2, n_ext - 1)
+    sos_pass_tile(sos, ext, z1, z2, True)
+
+    for lane in range(width):
+        for i in range(n_samp):
+            out[c0 + lane, i] = ext[padlen + i, lane]
+
+
+@njit(parallel=True, nogil=True, fastmath=True, cache=True)
+def sosfilt_stream(sos, x, state, out):
+    """
+    Causal SOS filtering of one chunk, carrying section states between calls.
+
+    Args:
+        sos (np.ndarray): Filter coefficients [n_sections x 6], a0 == 1.
+        x (np.ndarray): C-contiguous chunk [channels x samples].
+        state (np.ndarray): Section states [n_sections x channels x 2], updated in place.
+        out (np.ndarray): Output buffer, same shape as `x` (may be `x` itself).
+
+    Returns:
+        np.ndarray: `out`, holding the filtered chunk.
+    """
+    n_tiles = (x.shape[0] + LANES - 1) // LANES
+    for t in prange(n_tiles):
+        sosfilt_stream_tile(sos, x, state, out, t)
+    return out
+
+
+@njit(parallel=True, nogil=True, fastmath=True, cache=True)
+def sosfiltfilt(sos, x, zi, padlen, out):
+    """
+    Zero-phase SOS filtering of every channel (forward + backward pass).
+
+    Mirrors scipy.signal.sosfiltfilt with padtype='odd': each channel is
+    extended by an odd reflection of `padlen` samples on both ends and the
+    section states are seeded with steady-state `zi` scaled by the edge value.
+
+    Channels are processed in tiles of LANES; the last tile is padded
+    with zero lanes, which stay zero and are discarded.
+
+    Args:
+        sos (np.ndarray): Filter coefficients [n_sections x 6], a0 == 1.
+        x (np.ndarray): C-contiguous signal matrix [channels x samples].
+        zi (np.ndarray): Steady-state section states [n_sections x 2] (sosfilt_zi).
+        padlen (int): Number of reflected samples added on each edge.
+        out (np.ndarray): Output buffer, same shape as `x` (may be `x` itself).
+
+    Returns:
+        np.ndarray: `out`, holding the filtered signal.
+    """
+    n_tiles = (x.shape[0] + LANES - 1) // LANES
+    for t in prange(n_tiles):
+        sosfiltfilt_tile(sos, x, zi, padlen, out, t)
+    return out
+
+
+# Per-dtype entry points, matching the names exported by _sos_kernels.
+sosfiltfilt_f32 = sosfiltfilt_f64 = sosfiltfilt
+sosfilt_stream_f32 = sosfilt_stream_f64 = sosfilt_stream
@@ -4,17 +4,238 @@ This module provides utilities for loading and preprocessing EEG data
 following the methodology of O'Connell et al. (2009)
 """
 
+import os
 import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Tuple, Dict, List, Any
+from functools import lru_cache
+from typing import Tuple, Dict, List, Any, Optional, Iterable, Iterator
 from scipy import signal as sp_signal
 from obci_readmanager.signal_processing.read_manager import ReadManager
 
+# The parallel, GIL-releasing JIT kernels are the default. The ahead-of-time
+# build (no JIT warm-up, but serial and holding the GIL) is opt-in via
+# EEG_SOS_AOT=1 and only used if it has been built.
+_k = None
+if os.environ.get("EEG_SOS_AOT") == "1":
+    try:
+        from . import _sos_kernels as _k
+    except ImportError:
+        _k = None
+if _k is None:
+    from . import _sos_jit as _k
+
 
 # Signal scaling factor for OBCI amplifier
 VOLTAGE_SCALING = 0.0715
 
+# Default read size for chunked processing of raw files (100 MiB).
+CHUNK_BYTES = 100 * 1024 * 1024
+
+# OBCI 'sample_type' parameter -> on-disk dtype of the .raw file.
+OBCI_SAMPLE_TYPES = {"DOUBLE": "<f8", "FLOAT": "<f4"}
+
+# Alignment (bytes) of reusable signal buffers - one memory page, so they
+# can later be page-locked for device transfers.
+BUFFER_ALIGNMENT = 4096
+
+
+# --- Compiled Kernels ---
+def _kernel(name: str, dtype: np.dtype):
+    """
+    Picks the float32 or float64 entry point of a compiled SOS kernel.
+    """
+    return getattr(_k, f"{name}_{'f32' if dtype == np.float32 else 'f64'}")
+
+
+def _output_buffer(data: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Returns `out` after checking it can hold the result, or a new buffer.
+
+    Raises:
+        ValueError: If `out` does not match the shape/dtype of `data` or is not C-contiguous.
+    """
+    if out is None:
+        return np.empty_like(data)
+    if out.shape != data.shape or out.dtype != data.dtype or not out.flags.c_contiguous:
+        raise ValueError(
+            f"Output buffer must be a C-contiguous {data.dtype} array of shape {data.shape}.")
+    return out
+
+
+def _sosfiltfilt(sos: np.ndarray,
+                 data: np.ndarray,
+                 out: Optional[np.ndarray] = None
+                 ) -> np.ndarray:
+    """
+    Prepares padding and initial states, then runs the compiled kernel.
+
+    Args:
+        sos (np.ndarray): Filter coefficients [n_sections x 6].
+        data (np.ndarray): The EEG signal matrix [channels x samples].
+        out (np.ndarray, optional): Destination buffer (may be `data` itself).
+
+    Returns:
+        np.ndarray: The zero-phase filtered signal.
+
+    Raises:
+        ValueError: If the signal is too short for the edge padding.
+    """
+    # Same default padlen as scipy.signal.sosfiltfilt (trailing zeros trimmed).
+    n_sec = sos.shape[0]
+    n_zeros = min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    padlen = 3 * (2 * n_sec + 1 - n_zeros)
+
+    if data.shape[-1] <= padlen:
+        raise ValueError(
+            f"Signal length ({data.shape[-1]}) must exceed padlen ({padlen}).")
+
+    out = _output_buffer(data, out)
+    zi = sp_signal.sosfilt_zi(sos).astype(data.dtype)
+    kernel = _kernel("sosfiltfilt", data.dtype)
+    return kernel(sos.astype(data.dtype), data, zi, int(padlen), out)
+
+
+def _steady_state(sos: np.ndarray, data: np.ndarray) -> np.ndarray:
+    """
+    Initial section states [n_sections x channels x 2] for forward filtering.
+
+    Each channel starts in steady state for its first sample (sosfilt_zi
+    scaled by x[c, 0]), matching the initial conditions used by sosfiltfilt.
+    """
+    zi = sp_signal.sosfilt_zi(sos).astype(data.dtype)
+    return np.ascontiguousarray(zi[:, np.newaxis, :] * data[np.newaxis, :, 0, np.newaxis])
+
+
+def _sosfilt(sos: np.ndarray,
+             data: np.ndarray,
+             out: Optional[np.ndarray] = None
+             ) -> np.ndarray:
+    """
+    Forward-only SOS filtering of all channels with the compiled kernel.
+
+    Args:
+        sos (np.ndarray): Filter coefficients [n_sections x 6].
+        data (np.ndarray): The EEG signal matrix [channels x samples].
+        out (np.ndarray, optional): Destination buffer (may be `data` itself).
+
+    Returns:
+        np.ndarray: The causally filtered signal.
+    """
+    out = _output_buffer(data, out)
+    kernel = _kernel("sosfilt_stream", data.dtype)
+    return kernel(sos.astype(data.dtype), data, _steady_state(sos, data), out)
+
+
+def _as_channel_rows(data: np.ndarray) -> np.ndarray:
+    """
+    Validates the [channels x samples] layout expected by the filters.
+
+    The array is never transposed (channel/sample counts cannot be told apart
+    reliably); it is only copied when it is not C-contiguous, so the IIR
+    recursion walks each channel with unit stride. Dtypes other than
+    float32/float64 are promoted to float64, the types the kernels support.
+
+    Raises:
+        ValueError: If the data is not a 2-D matrix.
+    """
+    if data.ndim != 2:
+        raise ValueError(
+            f"Expected EEG data as [channels x samples], got shape {data.shape}.")
+    if data.dtype not in (np.float32, np.float64):
+        data = data.astype(np.float64)
+    if not data.flags.c_contiguous:
+        data = np.ascontiguousarray(data)
+    return data
+
+
+@lru_cache(maxsize=32)
+def _ones_row(n: int, dtype: str) -> np.ndarray:
+    """
+    Read-only (1 x n) row of ones used to sum rows via matrix product.
+    """
+    ones = np.ones((1, n), dtype=dtype)
+    ones.flags.writeable = False
+    return ones
+
+
+# --- Filter Design (cached) ---
+@lru_cache(maxsize=32)
+def _design_bandpass_sos(order: int, lowcut: float, highcut: float, fs: float) -> np.ndarray:
+    """
+    Designs a Butterworth bandpass filter in SOS format.
+
+    Results are cached per parameter set, so the returned array is read-only.
+    """
+    sos = sp_signal.butter(
+        order,
+        [lowcut, highcut],
+        btype='bandpass',
+        output='sos',
+        fs=fs
+    )
+    sos.flags.writeable = False
+    return sos
+
+
+@lru_cache(maxsize=32)
+def _bandpass_group_delay(order: int, lowcut: float, highcut: float, fs: float) -> int:
+    """
+    Typical group delay (in samples) of the bandpass filter over its passband.
+
+    The median is used because the Butterworth delay peaks sharply at the
+    band edges, which would dominate a plain mean.
+    """
+    sos = _design_bandpass_sos(order, lowcut, highcut, fs)
+    passband = np.linspace(lowcut, highcut, 64)
+
+    # Sum per-section delays: the cascade's 'ba' form is ill-conditioned.
+    gd = np.zeros_like(passband)
+    for section in sos:
+        gd += sp_signal.group_delay((section[:3], section[3:]), w=passband, fs=fs)[1]
+    return int(round(float(np.median(gd))))
+
+
+@lru_cache(maxsize=32)
+def _design_notch_sos(freq: float, quality_factor: float, fs: float) -> np.ndarray:
+    """
+    Designs an IIR notch filter and converts it to SOS format.
+
+    Results are cached per parameter set, so the returned array is read-only.
+    """
+    # Design Notch filter (Transfer Function representation).
+    b, a = sp_signal.iirnotch(freq, quality_factor, fs)
+
+    # Convert to SOS for stability (important for high precision).
+    sos = sp_signal.tf2sos(b, a)
+    sos.flags.writeable = False
+    return sos
+
+
+def _design_cascade_sos(fs: float, stages: List[Tuple]) -> np.ndarray:
+    """
+    Stacks the cached SOS designs of all stages into one cascade.
+
+    Raises:
+        ValueError: If a stage type is unknown or no stages are given.
+    """
+    if not stages:
+        raise ValueError("Filter cascade requires at least one stage.")
+
+    sections = []
+    for stage in stages:
+        kind, *params = stage
+        if kind == "notch":
+            freq, quality_factor = params
+            sections.append(_design_notch_sos(freq, quality_factor, fs))
+        elif kind == "bandpass":
+            lowcut, highcut, order = params
+            sections.append(_design_bandpass_sos(order, lowcut, highcut, fs))
+        else:
+            raise ValueError(f"Unknown filter stage: {kind!r}.")
+
+    return np.vstack(sections)
+
 
 # --- Data Structures (The "Headers") ---
 @dataclass(frozen=True)
@@ -36,6 +257,25 @@ class EEGMetadata:
     tags: Any
 
 
+def _resolve_channels(metadata: EEGMetadata, ref_channels: List[str]) -> np.ndarray:
+    """
+    Converts channel names to a contiguous int32 index array.
+
+    Args:
+        metadata (EEGMetadata): Session header with the channel map.
+        ref_channels (List[str]): Channel names to look up.
+
+    Returns:
+        np.ndarray: Matrix row indices of the requested channels.
+
+    Raises:
+        KeyError: If a channel name is not present in the metadata.
+    """
+    return np.fromiter((metadata.channel_map[ch] for ch in ref_channels),
+                       dtype=np.int32,
+                       count=len(ref_channels))
+
+
 def file_load(xml_file: str,
               raw_file: str,
               tag_file: str
@@ -77,13 +317,18 @@ def get_session_metadata(read_manager: ReadManager) -> EEGMetadata:
     )
 
 
-def get_eeg_signal(read_manager: ReadManager) -> np.ndarray:
+def get_eeg_signal(read_manager: ReadManager, dtype: np.dtype = np.float32) -> np.ndarray:
     """
     Extracts and scales the raw signal.
     Separate from metadata for better modularity.
 
+    The signal is stored as float32 by default: the amplifier resolution
+    (~0.07 uV) is far below float32 precision, and the smaller dtype halves
+    the memory traffic of every later preprocessing step.
+
     Args:
         read_manager (ReadManager): The manager object connected to EEG files.
+        dtype (np.dtype): Output dtype. Default float32; pass np.float64 for full precision.
 
     Returns:
         np.ndarray: Scaled EEG signal matrix in microvolts [channels x samples].
@@ -96,8 +341,188 @@ def get_eeg_signal(read_manager: ReadManager) -> np.ndarray:
         raise ValueError("readManager returned empty signal data.")
 
     # CRITICAL: Scaling is multiplication, not additional!
-    signal *= VOLTAGE_SCALING
-    return signal
+    # Always scale into a new C-contiguous array: get_samples() may return the
+    # ReadManager's internal cache, which must not be modified.
+    scaled = np.empty(signal.shape, dtype=dtype)
+    np.multiply(signal, VOLTAGE_SCALING, out=scaled, casting='same_kind')
+    return scaled
+
+
+def aligned_empty(shape: Tuple[int, ...],
+                  dtype: np.dtype = np.float32,
+                  alignment: int = BUFFER_ALIGNMENT
+                  ) -> np.ndarray:
+    """
+    Allocates an uninitialized C-contiguous array aligned to `alignment` bytes.
+
+    The array is a view into an over-allocated, uninitialized NumPy byte
+    buffer (buffer protocol), offset to the first aligned address.
+
+    Args:
+        shape (Tuple[int, ...]): Shape of the array, e.g. (channels, samples).
+        dtype (np.dtype): Element type. Default float32.
+        alignment (int): Required address alignment in bytes. Default 4096.
+
+    Returns:
+        np.ndarray: Aligned, uninitialized array.
+    """
+    dtype = np.dtype(dtype)
+    n_bytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(n_bytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + n_bytes].view(dtype).reshape(shape)
+
+
+def get_eeg_signal_into(read_manager: ReadManager,
+                        out: Optional[np.ndarray] = None
+                        ) -> np.ndarray:
+    """
+    Extracts and scales the raw signal into a reusable buffer.
+
+    Intended for batch runs over many subjects: pass the array returned by
+    the previous call as `out` to avoid a new full-size allocation per file.
+
+    Args:
+        read_manager (ReadManager): The manager object connected to EEG files.
+        out (np.ndarray, optional): Destination floating-point [channels x samples]
+            buffer. If None, an aligned float32 buffer is allocated.
+
+    Returns:
+        np.ndarray: Scaled EEG signal matrix in microvolts (`out` if given).
+
+    Raises:
+        ValueError: If the ReadManager returns no data, or `out` has the wrong
+            shape or a non-floating dtype.
+    """
+    if out is not None and not np.issubdtype(out.dtype, np.floating):
+        raise ValueError(f"Output buffer must have a floating dtype, got {out.dtype}.")
+
+    signal = read_manager.get_samples()
+    if signal is None or signal.size == 0:
+        raise ValueError("readManager returned empty signal data.")
+
+    if out is None:
+        out = aligned_empty(signal.shape, dtype=np.float32)
+    elif out.shape != signal.shape:
+        raise ValueError(
+            f"Output buffer shape {out.shape} does not match signal shape {signal.shape}.")
+
+    # Scale and cast in a single pass, straight into the destination.
+    np.multiply(signal, VOLTAGE_SCALING, out=out, casting='same_kind')
+    return out
+
+
+def iter_eeg_chunks(read_manager: ReadManager,
+                    raw_file: str,
+                    chunk_bytes: int = CHUNK_BYTES,
+                    dtype: np.dtype = np.float32
+                    ) -> Iterator[np.ndarray]:
+    """
+    Streams the scaled signal from a memory-mapped OBCI .raw file in chunks.
+
+    At most two chunks are held in memory at a time, so peak RSS is bounded
+    by `chunk_bytes` instead of the recording length. While the caller works
+    on one chunk, the next one is read from disk and scaled on a worker
+    thread. That thread runs only NumPy code (no Numba kernels), so it is
+    safe with every Numba threading layer.
+
+    Args:
+        read_manager (ReadManager): The manager object connected to EEG files (for params).
+        raw_file (str): Path to the raw EEG data file (samples interleaved by channel).
+        chunk_bytes (int): Approximate size of one on-disk chunk. Default 100 MiB.
+        dtype (np.dtype): Floating-point output dtype. Default float32.
+
+    Yields:
+        np.ndarray: Scaled chunk in microvolts [channels x chunk_samples].
+
+    Raises:
+        ValueError: If `dtype` is not floating point, the sample type is
+            unsupported or the file is empty.
+    """
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"Chunk dtype must be floating point, got {np.dtype(dtype)}.")
+
+    params = read_manager.get_params()
+    n_ch = int(params.get("number_of_channels", 0))
+    sample_type = params.get("sample_type", "DOUBLE")
+    if sample_type not in OBCI_SAMPLE_TYPES:
+        raise ValueError(f"Unsupported OBCI sample type: {sample_type!r}.")
+
+    raw_dtype = np.dtype(OBCI_SAMPLE_TYPES[sample_type])
+    mm = np.memmap(raw_file, dtype=raw_dtype, mode='r')
+    if mm.size == 0 or n_ch == 0:
+        raise ValueError("Raw file contains no signal data.")
+
+    # On disk: [samples x channels]. Read by sample ranges, emit [channels x samples].
+    samples = mm[:mm.size - mm.size % n_ch].reshape(-1, n_ch)
+    chunk_samples = max(1, chunk_bytes // (n_ch * raw_dtype.itemsize))
+
+    def read_chunk(start: int) -> np.ndarray:
+        block = samples[start:start + chunk_samples]
+        chunk = np.empty((n_ch, block.shape[0]), dtype=dtype)
+        np.multiply(block.T, VOLTAGE_SCALING, out=chunk, casting='same_kind')
+        return chunk
+
+    if samples.shape[0] == 0:
+        return
+
+    # Prefetch: submit the read of chunk k+1 before handing out chunk k.
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        pending = prefetch.submit(read_chunk, 0)
+        for start in range(chunk_samples, samples.shape[0], chunk_samples):
+            chunk = pending.result()
+            pending = prefetch.submit(read_chunk, start)
+            yield chunk
+        yield pending.result()
+
+
+def stream_filter_cascade(
+        chunks: Iterable[np.ndarray],
+        fs: float,
+        stages: List[Tuple]
+) -> Iterator[np.ndarray]:
+    """
+    Causally filters a stream of chunks with one SOS cascade.
+
+    Section states are carried from chunk to chunk, so the concatenated output
+    equals forward filtering of the whole recording. States of the first chunk
+    start in steady state for its first sample, which avoids a step transient.
+    Unlike apply_filter_cascade the result is not zero-phase.
+
+    `chunks` is consumed on the calling thread, so it may itself run Numba
+    code (e.g. another stream_filter_cascade). Read-ahead from disk is done
+    by iter_eeg_chunks.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Consecutive [channels x samples] chunks.
+        fs (float): Sampling frequency in Hz.
+        stages (List[Tuple]): Filter stages, as in apply_filter_cascade.
+
+    Yields:
+        np.ndarray: The filtered chunk.
+
+    Raises:
+        ValueError: If a chunk has no samples, or its channel count or dtype
+            differs from the first chunk.
+    """
+    sos = _design_cascade_sos(fs, stages)
+    kernel = sos_c = state = None
+
+    for chunk in chunks:
+        # Layout validation: [channels x samples], C-contiguous rows.
+        chunk = _as_channel_rows(chunk)
+        if chunk.shape[1] == 0:
+            raise ValueError("Stream chunk contains no samples.")
+        if state is None:
+            kernel = _kernel("sosfilt_stream", chunk.dtype)
+            sos_c = sos.astype(chunk.dtype)
+            state = _steady_state(sos, chunk)
+        elif chunk.shape[0] != state.shape[1] or chunk.dtype != state.dtype:
+            # The kernel indexes the carried state without bounds checks.
+            raise ValueError(
+                f"Stream chunk ({chunk.shape[0]} channels, {chunk.dtype}) does not match "
+                f"the first chunk ({state.shape[1]} channels, {state.dtype}).")
+        yield kernel(sos_c, chunk, state, np.empty_like(chunk))
 
 
 def apply_bandpass_filter(
@@ -105,7 +530,9 @@ def apply_bandpass_filter(
         fs: float,
         lowcut: float,
         highcut: float,
-        order: int = 4
+        order: int = 4,
+        zero_phase: bool = True,
+        out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Applies a Butterworth bandpass filter using Second-Order Section (SOS).
@@ -113,33 +540,53 @@ def apply_bandpass_filter(
     Thsi method is numerically stable for high-order filters and low frequencies 
     compared to the standard 'ba' (Transfer Funtion) representation.
 
+    With zero_phase=False the filter runs forward only (half the work) and the
+    output is shifted back by the median passband group delay. This is only an
+    approximation of zero phase: the Butterworth delay varies across the band
+    and the magnitude response is applied once instead of squared. The
+    trailing samples left uncovered by the shift are set to zero.
+
     Args:
        data (np.ndarray): The EEG signal matrix [channels x samples].
        fs (float): Sampling frequency in Hz.
        lowcut (float): Lower bound of the frequency band.
        highcut (float): High bound of the frequency band.
        order (int): Yhe order of the filter. Default 4.
+       zero_phase (bool): If True (default), filter forward and backward.
+           If False, use a single forward pass with group-delay compensation.
+       out (np.ndarray, optional): Preallocated C-contiguous output buffer of the
+           same shape and dtype; may be `data` itself to filter in place.
 
     Returns:
-       np.ndarray: The zero-phase filtered signal.
-    """
-    # Defensive axis validation.
-    if data.shape[0] > data.shape[1]:
-        print("Warning: Input data appears to be transposed. Correcting...")
-        data = data.T
+       np.ndarray: The filtered signal (`out` if given).
 
-    # Design the filter in SOS format.
-    sos = sp_signal.butter(
-        order,
-        [lowcut, highcut],
-        btype='bandpass',
-        output='sos',
-        fs=fs
-    )
+    Raises:
+       ValueError: If the data is not a [channels x samples] matrix, `out` does not match it,
+           or (zero_phase=False) the signal is not longer than the group delay.
+    """
+    # Layout validation: [channels x samples], C-contiguous rows.
+    data = _as_channel_rows(data)
+
+    # Design the filter in SOS format (cached between calls).
+    sos = _design_bandpass_sos(order, lowcut, highcut, fs)
+
+    if not zero_phase:
+        # Forward-only filtering, then shift left by the known group delay.
+        delay = _bandpass_group_delay(order, lowcut, highcut, fs)
+        n_samp = data.shape[1]
+        if n_samp <= delay:
+            raise ValueError(
+                f"Signal length ({n_samp}) must exceed the filter group delay ({delay}) "
+                f"for zero_phase=False.")
+
+        filtered_data = _sosfilt(sos, data, out)
+        filtered_data[:, :n_samp - delay] = filtered_data[:, delay:]
+        filtered_data[:, n_samp - delay:] = 0
+        return filtered_data
 
     # Apply the filter forward and backward (zero-phase shift).
-    # This is equivalent to filtfilt but for SOS.
-    filtered_data = sp_signal.sosfiltfilt(sos, data, axis=-1)
+    # This is equivalent to sosfiltfilt, compiled and parallel over channels.
+    filtered_data = _sosfiltfilt(sos, data, out)
 
     return filtered_data
 
@@ -148,7 +595,8 @@ def apply_notch_filter(
         data: np.ndarray,
         fs: float,
         freq: float = 50,
-        quality_factor: float = 30
+        quality_factor: float = 30,
+        out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Applies an IIR Notch filter to remove specific power line noise.
@@ -160,23 +608,62 @@ def apply_notch_filter(
         fs (float): Sampling frequency in Hz.
         freq (float): The frequency to be removed (e.g., 50Hz for EU power lines).
         quality_factor (float): The Q-factor, determining the notch width. Default is 30.
+        out (np.ndarray, optional): Preallocated C-contiguous output buffer of the
+            same shape and dtype; may be `data` itself to filter in place.
 
     Returns:
-        np.ndarray: The signal with the specific frequency removed. 
-    """
-    # Defensive axis validation.
-    if data.shape[0] > data.shape[1]:
-        print("Warning: Input data appears to be transposed. Correcting...")
-        data = data.T
+        np.ndarray: The signal with the specific frequency removed (`out` if given).
 
-    # Design Notch filter (Transfer Function representation).
-    b, a = sp_signal.iirnotch(freq, quality_factor, fs)
+    Raises:
+        ValueError: If the data is not a [channels x samples] matrix or `out` does not match it.
+    """
+    # Layout validation: [channels x samples], C-contiguous rows.
+    data = _as_channel_rows(data)
 
-    # Convert to SOS for stability (important for high precision).
-    sos = sp_signal. tf2sos(b, a)
+    # Design Notch filter as SOS for stability (cached between calls).
+    sos = _design_notch_sos(freq, quality_factor, fs)
 
     # Apply zero-phase filtration.
-    filtered_data = sp_signal.sosfiltfilt(sos, data, axis=-1)
+    filtered_data = _sosfiltfilt(sos, data, out)
+
+    return filtered_data
+
+
+def apply_filter_cascade(
+        data: np.ndarray,
+        fs: float,
+        stages: List[Tuple],
+        out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Applies several SOS filters as one cascade in a single zero-phase pass.
+
+    Stacking the sections of every stage lets the signal be traversed once
+    (forward + backward) instead of once per filter.
+
+    Args:
+        data (np.ndarray): The EEG signal matrix [channels x samples].
+        fs (float): Sampling frequency in Hz.
+        stages (List[Tuple]): Filter stages applied in order, each one of:
+            ("notch", freq, quality_factor)
+            ("bandpass", lowcut, highcut, order)
+        out (np.ndarray, optional): Preallocated C-contiguous output buffer of the
+            same shape and dtype; may be `data` itself to filter in place.
+
+    Returns:
+        np.ndarray: The zero-phase filtered signal (`out` if given).
+
+    Raises:
+        ValueError: If a stage type is unknown, no stages are given, the
+            data is not a [channels x samples] matrix, or `out` does not match it.
+    """
+    sos = _design_cascade_sos(fs, stages)
+
+    # Layout validation: [channels x samples], C-contiguous rows.
+    data = _as_channel_rows(data)
+
+    # One zero-phase pass over the combined sections.
+    filtered_data = _sosfiltfilt(sos, data, out)
 
     return filtered_data
 
@@ -184,7 +671,10 @@ def apply_notch_filter(
 def reference(
         data: np.ndarray,
         metadata: EEGMetadata,
-        ref_channels: list = None
+        ref_channels: list = None,
+        copy: bool = True,
+        out: Optional[np.ndarray] = None,
+        scratch: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Applies re-referencing to the EEG signal.
@@ -193,37 +683,78 @@ def reference(
         data (np.ndarray): The EEG signal matrix [channels x samples].
         metadata (EEGMetadata): Array with names and indices of channels.
         ref_channels (List): List of channels names for reference. If empty, apply Common Average Reference.
+        copy (bool): If True (default), write the result to a new array. If False,
+            re-reference `data` in place - the caller's array is overwritten and
+            must not be used as the raw signal afterwards.
+        out (np.ndarray, optional): Preallocated output buffer of the same shape;
+            takes precedence over `copy`.
+        scratch (np.ndarray, optional): Reusable C-contiguous buffer
+            [len(ref_channels) x samples] of data's dtype for the gathered
+            reference rows. Lets repeated calls skip that allocation; the caller
+            owns it and must not share it between concurrent calls. Ignored for CAR.
 
     Returns:
-        np.ndarray: The signal after reference apply.
+        np.ndarray: The signal after reference apply (`out` if given, `data` itself when copy=False).
+
+    Raises:
+        ValueError: If `data` is not floating point, or `out` or `scratch` does
+            not match the signal.
     """
-    # Create a deep copy to avoid modyfing original data.
-    data_copy = data.copy()  # Added parentheses!
+    # The mean is computed in data's dtype; integer input would truncate it.
+    if not np.issubdtype(data.dtype, np.floating):
+        raise ValueError(f"Reference requires floating-point data, got {data.dtype}.")
+
+    # Allocate the output once, or reuse the given / input buffer.
+    # The reference is computed into its own row before any write, so
+    # in-place operation is safe.
+    if out is None:
+        out = np.empty_like(data) if copy else data
+    elif out.shape != data.shape:
+        raise ValueError(
+            f"Output buffer shape {out.shape} does not match signal shape {data.shape}.")
 
     # 2. Handle Comon Average Reference.
     if not ref_channels:
-        # slice(None) is the internal Python equivalent of ":".
-        # It selects ALL indices efficiently.
-        ref_indices = slice(None)
-        print("Status: Applied Common Average Reference (CAR).")
+        # All rows take part, so no row selection is needed.
+        ref_rows = data
+        status = "Status: Applied Common Average Reference (CAR)."
 
     # Handle Specific Channel Reference.
     else:
         try:
-            ref_indices = [metadata.channel_map[ch] for ch in ref_channels]
-            print(f"Status: Applied reference to channels: {ref_channels}")
+            ref_indices = _resolve_channels(metadata, ref_channels)
         except KeyError as e:
-            # If a channel is missing, we stop and return the original copy.
+            # If a channel is missing, we stop and return the original data.
             print(
                 f"Critical Error: Channel {e} not found in metadata. Skipping reference.")
-            return data_copy
-
-    # The ONLY math call - univeral for both CAR and specific channels.
-    # If ref_indices is slice(None), it takes all rows.
-    # If ref_indices is a list, it takes only those rows.
-    ref_data = np.mean(data_copy[ref_indices, :], axis=0)
-
-    # Substract reference signal from all channels.
-    data_copy -= ref_data
-
-    return data_copy
+            if out is not data:
+                out[...] = data
+            return out
+
+        # Gather the reference rows into one contiguous block, reusing the
+        # caller's scratch buffer when given.
+        if scratch is None:
+            ref_rows = data[ref_indices]
+        else:
+            shape = (len(ref_indices), data.shape[1])
+            if (scratch.shape != shape or scratch.dtype != data.dtype
+                    or not scratch.flags.c_contiguous):
+                raise ValueError(
+                    f"Scratch buffer must be a C-contiguous {shape} {data.dtype} array, "
+                    f"got {scratch.shape} {scratch.dtype}.")
+            ref_rows = np.take(data, ref_indices, axis=0, out=scratch)
+        status = f"Status: Applied reference to channels: {ref_channels}"
+
+    # Mean over the reference rows as a BLAS matrix-vector product (ones @ rows),
+    # which is a SIMD reduction instead of NumPy's generic axis-0 loop.
+    n_sel = ref_rows.shape[0]
+    ref_data = (_ones_row(n_sel, data.dtype.str) @ ref_rows).ravel()
+    ref_data *= ref_data.dtype.type(1.0 / n_sel)
+
+    # Substract reference signal from all channels in one fused ufunc pass.
+    # ref_data is a contiguous row of data's dtype, so the broadcast needs
+    # no casting temporary.
+    np.subtract(data, ref_data[np.newaxis, :], out=out)
+    print(status)
+
+    return out
@@ -0,0 +1,80 @@
+"""
+Profiling helpers for the preprocessing pipeline.
+Per-stage wall-clock timing and optional pyinstrument call graphs.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Any, Iterator
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+
+def _peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of this process in MB (NaN if unknown).
+    """
+    if resource is None:
+        return float("nan")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Times a pipeline stage and prints its duration and the peak RSS so far.
+
+    Args:
+        name (str): Label printed with the measurement, e.g. "reference".
+
+    Example:
+        with stage("reference"):
+            ref_signal = reference(...)
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        duration_ms = (time.perf_counter_ns() - start) / 1e6
+        print(f"[{name}] {duration_ms:.1f} ms, peak RSS={_peak_rss_mb():.0f}MB")
+
+
+def run_with_pyinstrument(func: Callable[[], Any], output_html: str) -> Any:
+    """
+    Runs `func` under the pyinstrument sampling profiler and saves an HTML report.
+
+    Sampling (1 ms interval) adds little overhead to C-heavy NumPy/SciPy code,
+    unlike cProfile which instruments every Python-level call.
+
+    Args:
+        func (Callable): Zero-argument callable to profile (e.g. main).
+        output_html (str): Path of the HTML call graph to write.
+
+    Returns:
+        Any: Whatever `func` returns.
+
+    Raises:
+        ImportError: If pyinstrument is not installed.
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError as e:
+        raise ImportError(
+            "pyinstrument is required for --profile pyinstrument (pip install pyinstrument).") from e
+
+    profiler = Profiler(interval=0.001)
+    profiler.start()
+    try:
+        return func()
+    finally:
+        profiler.stop()
+        with open(output_html, "w", encoding="utf-8") as f:
+            f.write(profiler.output_html())
+        print(f"Status: Profile written to {output_html}")
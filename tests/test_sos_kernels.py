@@ -0,0 +1,52 @@
+"""
+Equivalence of the Numba SOS kernels with scipy.signal.
+"""
+
+import numpy as np
+import pytest
+from scipy import signal as sp_signal
+
+from src.utils import _sos_jit
+
+
+FS = 512.0
+SOS = np.vstack([
+    sp_signal.tf2sos(*sp_signal.iirnotch(50.0, 30, FS)),
+    sp_signal.butter(4, [1.0, 40.0], btype='bandpass', output='sos', fs=FS),
+])
+
+
+def _padlen(sos):
+    # Same default as scipy.signal.sosfiltfilt.
+    n_zeros = min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    return 3 * (2 * sos.shape[0] + 1 - n_zeros)
+
+
+@pytest.mark.parametrize("n_ch", [1, 7, 13])
+@pytest.mark.parametrize("in_place", [False, True])
+def test_sosfiltfilt_matches_scipy(n_ch, in_place):
+    x = np.random.default_rng(n_ch).standard_normal((n_ch, 3000)) * 30
+    expected = sp_signal.sosfiltfilt(SOS, x, axis=-1)
+
+    data = x.copy()
+    out = data if in_place else np.empty_like(data)
+    result = _sos_jit.sosfiltfilt(SOS, data, sp_signal.sosfilt_zi(SOS), _padlen(SOS), out)
+
+    assert result is out
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("n_ch", [1, 7, 13])
+def test_sosfilt_stream_matches_scipy(n_ch):
+    x = np.random.default_rng(n_ch).standard_normal((n_ch, 3000)) * 30
+    zi = sp_signal.sosfilt_zi(SOS)[:, np.newaxis, :] * x[np.newaxis, :, 0, np.newaxis]
+    expected, expected_state = sp_signal.sosfilt(SOS, x, axis=-1, zi=zi)
+
+    # Uneven chunks (the last one filtered in place) with carried state.
+    state = np.ascontiguousarray(zi)
+    chunks = [np.ascontiguousarray(x[:, a:b]) for a, b in [(0, 1000), (1000, 1001), (1001, 3000)]]
+    outputs = [_sos_jit.sosfilt_stream(SOS, c, state, np.empty_like(c)) for c in chunks[:-1]]
+    outputs.append(_sos_jit.sosfilt_stream(SOS, chunks[-1], state, chunks[-1]))
+
+    np.testing.assert_allclose(np.concatenate(outputs, axis=1), expected, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(state, expected_state, rtol=0, atol=1e-9)